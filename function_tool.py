@@ -9,18 +9,419 @@ Functions:
 - search_adzuna_jobs: Search for jobs using Adzuna API
 - get_adzuna_histogram: Get salary distribution data from Adzuna
 - get_adzuna_top_companies: Get top hiring companies from Adzuna
+- warmup_connections: Pre-open pooled connections to both APIs
+
+Each network function also has an ``*_async`` variant that shares one pooled
+``httpx.AsyncClient`` so concurrent tool calls do not block the event loop.
 
 Author: ADK Demo
 Date: November 13, 2025
 """
 
 import os
+import asyncio
+import functools
+import html
+import inspect
+import threading
+import orjson
+import msgspec
 import requests
-from typing import Dict, Any, Optional
-from bs4 import BeautifulSoup
+import httpx
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader, MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from urllib.parse import urlencode
 import re
+from collections import Counter
+
+
+# Job descriptions are short HTML snippets; a tag regex is far cheaper than building a parse tree
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\n+')
+
+_FINDSG_SEARCH_URL = "https://www.findsgjobs.com/apis/job/searchable"
+_FINDSG_JOB_URL = "https://www.findsgjobs.com/job/{}".format
+
+# Adzuna credentials are read once; app.py loads .env before importing this module
+_CREDS = (os.environ.get("ADZUNA_APP_ID"), os.environ.get("ADZUNA_APP_KEY"))
+_CREDS_OK = all(_CREDS)
+# Pre-encoded credential prefix so each request only encodes its variable params
+_CRED_QS = urlencode({"app_id": _CREDS[0], "app_key": _CREDS[1]}) if _CREDS_OK else ""
+# Returned by every Adzuna function while credentials are missing; never mutated
+_MISSING_CREDS_ERR: Dict[str, Any] = {
+    "success": False,
+    "error": "ADZUNA_APP_ID and ADZUNA_APP_KEY environment variables must be set. Get your credentials from https://developer.adzuna.com/"
+}
+
+# Adzuna uses country codes; map common names to codes (anything else is Singapore)
+_COUNTRY_MAP = {
+    "uk": "gb", "united kingdom": "gb", "gb": "gb",
+    "us": "us", "usa": "us", "united states": "us",
+    "au": "au", "australia": "au",
+}
+_ADZUNA_SEARCH_URL = "https://api.adzuna.com/v1/api/jobs/{}/search/{}".format
+_ADZUNA_HISTOGRAM_URL = "https://api.adzuna.com/v1/api/jobs/sg/histogram"
+_ADZUNA_TOP_COMPANIES_URL = "https://api.adzuna.com/v1/api/jobs/sg/top_companies"
+
+# Shared default for nested lookups on API payloads; never mutated
+_EMPTY: Dict[str, Any] = {}
+# Placeholder for arguments a caller omitted
+_MISSING = object()
+
+# Successful API responses; FindSGJobs entries are keyed on (function name, *arguments)
+_CACHE: TTLCache = TTLCache(maxsize=512, ttl=600)
+# Adzuna entries are keyed on (endpoint, canonical params without credentials)
+_ADZUNA_SEARCH_CACHE: TTLCache = TTLCache(maxsize=512, ttl=300)
+# Salary histograms and company leaderboards change slowly
+_ADZUNA_INSIGHTS_CACHE: TTLCache = TTLCache(maxsize=128, ttl=3600)
+_CACHE_LOCK = threading.Lock()
+# One shared task per in-flight async request, keyed on (event loop, cache key), so identical
+# concurrent calls all await a single fetch and get its result, success or failure
+_INFLIGHT: Dict[Tuple, asyncio.Task] = {}
+
+
+def _cache_get(cache: TTLCache, key: Tuple) -> Optional[Dict[str, Any]]:
+    with _CACHE_LOCK:
+        return cache.get(key)
+
+
+def _inflight_done(inflight_key: Tuple, task: asyncio.Task) -> None:
+    if _INFLIGHT.get(inflight_key) is task:
+        del _INFLIGHT[inflight_key]
+    # Mark an exception as retrieved in case every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+def _cache_set(cache: TTLCache, key: Tuple, result: Dict[str, Any]) -> None:
+    # Only successful responses are cached so transient failures are retried
+    if result.get("success"):
+        with _CACHE_LOCK:
+            cache[key] = result
+
+
+def _cached(
+    func: Optional[Callable] = None,
+    *,
+    cache: TTLCache = _CACHE,
+    key: Optional[Callable[..., Tuple]] = None
+) -> Callable:
+    """
+    Cache successful results of an API function in a TTL cache.
+
+    Use as ``@_cached`` to key on the function name and its arguments, or as
+    ``@_cached(cache=..., key=...)`` where ``key`` receives the bound arguments
+    as keyword arguments and returns the cache key.
+
+    Sync and ``*_async`` variants of the same function share cache entries.
+    Async callers with the same key also await one in-flight request instead
+    of each hitting the API, and all get its result even when it failed; only
+    the next call after a failure fetches again.
+    """
+    if func is None:
+        return functools.partial(_cached, cache=cache, key=key)
+
+    name = func.__name__.removesuffix("_async")
+    # Parameter names with their defaults, in order; binding by hand is much cheaper than
+    # Signature.bind on the cache-hit path. A missing required argument leaves
+    # _MISSING in the key, so the lookup misses and the call itself raises TypeError.
+    defaults = {
+        param.name: _MISSING if param.default is inspect.Parameter.empty else param.default
+        for param in inspect.signature(func).parameters.values()
+    }
+    names = tuple(defaults)
+
+    def make_key(args: Tuple, kwargs: Dict[str, Any]) -> Tuple:
+        arguments = defaults.copy()
+        arguments.update(zip(names, args))
+        arguments.update(kwargs)
+        if key is not None:
+            return key(**arguments)
+        return (name, *arguments.values())
+
+    if inspect.iscoroutinefunction(func):
+        async def fetch(args: Tuple, kwargs: Dict[str, Any], cache_key: Tuple) -> Dict[str, Any]:
+            result = await func(*args, **kwargs)
+            _cache_set(cache, cache_key, result)
+            return result
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            cache_key = make_key(args, kwargs)
+            cached = _cache_get(cache, cache_key)
+            if cached is not None:
+                return cached
+
+            loop = asyncio.get_running_loop()
+            inflight_key = (loop, cache_key)
+            task = _INFLIGHT.get(inflight_key)
+            if task is None:
+                task = loop.create_task(fetch(args, kwargs, cache_key))
+                _INFLIGHT[inflight_key] = task
+                task.add_done_callback(functools.partial(_inflight_done, inflight_key))
+            # Shielded so one cancelled caller does not cancel the fetch for the others
+            return await asyncio.shield(task)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache_key = make_key(args, kwargs)
+        cached = _cache_get(cache, cache_key)
+        if cached is not None:
+            return cached
+
+        result = func(*args, **kwargs)
+        _cache_set(cache, cache_key, result)
+        return result
+
+    return wrapper
+
+
+# Transient rate-limit and gateway errors, and failed connects, are retried with exponential
+# backoff before a request is reported as failed. Read timeouts are not retried, so a dead
+# backend costs one timeout rather than several. A Retry-After longer than _RETRY_AFTER_MAX
+# ends the retries at once, so the total wait stays within _RETRY_TOTAL * _RETRY_AFTER_MAX.
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_AFTER_MAX = 3.0
+
+
+class _Retry(Retry):
+    # Give up (returning the response, as raise_on_status=False) rather than honour a long Retry-After
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and error is None:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > _RETRY_AFTER_MAX:
+                raise MaxRetryError(_pool, url, ResponseError(f"Retry-After of {retry_after:.0f}s is too long"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+_RETRY = _Retry(
+    total=_RETRY_TOTAL,
+    read=False,
+    backoff_factor=_RETRY_BACKOFF,
+    status_forcelist=_RETRY_STATUSES,
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Pooled keep-alive connections for the sync API functions, so repeat calls skip the TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY))
+# Both APIs return verbose JSON that compresses several times over
+_COMPRESSED_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+_SESSION.headers.update(_COMPRESSED_HEADERS)
+
+# Adzuna gets its own pool so its retries never hold FindSGJobs connections
+_ADZUNA_SESSION = requests.Session()
+_ADZUNA_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+_ADZUNA_SESSION.headers.update({**_COMPRESSED_HEADERS, "Connection": "keep-alive"})
+
+# Shared async client, created lazily inside the running event loop
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+_ASYNC_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client for the current event loop.
+
+    The client is rebuilt if the loop changed (e.g. repeated ``asyncio.run``)
+    because its pooled connections are bound to the loop that opened them.
+    """
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT.is_closed or _ASYNC_CLIENT_LOOP is not loop:
+        # HTTP/2 multiplexes concurrent requests to the same host over one connection;
+        # servers without it negotiate HTTP/1.1 instead
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            headers=_COMPRESSED_HEADERS,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30)
+        )
+        _ASYNC_CLIENT_LOOP = loop
+    return _ASYNC_CLIENT
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return _RETRY.parse_retry_after(value)
+    except InvalidHeader:
+        return None
+
+
+async def _async_get(url: str, **kwargs) -> httpx.Response:
+    """
+    GET through the shared async client with the same retry policy as the sync sessions.
+
+    Mirrors urllib3's schedule: the first retry is immediate, later ones wait
+    ``_RETRY_BACKOFF * 2**(retry - 1)`` seconds, and a transient status with a
+    Retry-After waits that long instead. A Retry-After above ``_RETRY_AFTER_MAX``
+    returns the response without retrying. Timeouts are not retried.
+    """
+    client = _get_async_client()
+    for retry in range(1, _RETRY_TOTAL + 2):
+        last_attempt = retry > _RETRY_TOTAL
+        backoff = _RETRY_BACKOFF * 2 ** (retry - 1) if retry > 1 else 0.0
+        try:
+            response = await client.get(url, **kwargs)
+        except httpx.ConnectError:
+            if last_attempt:
+                raise
+            await asyncio.sleep(backoff)
+            continue
+        if response.status_code not in _RETRY_STATUSES or last_attempt:
+            return response
+        retry_after = _retry_after(response)
+        if retry_after is not None and retry_after > _RETRY_AFTER_MAX:
+            return response
+        await asyncio.sleep(retry_after or backoff)
+
+
+def _warm_session(session: requests.Session, url: str) -> None:
+    try:
+        session.head(url, timeout=5)
+    except requests.exceptions.RequestException:
+        pass
+
+
+# Event loop whose pooled connections have already been warmed
+_WARMED_LOOP: Optional[asyncio.AbstractEventLoop] = None
 
 
+async def warmup_connections() -> None:
+    """
+    Open pooled connections to both APIs ahead of the first real request.
+
+    Resolves DNS and completes the TLS handshakes so the first tool call reuses
+    a warm socket. Runs once per event loop, so it is safe to hook to every page
+    load; later calls on the same loop return immediately. The first call also
+    warms the FindSGJobs session used by the blocking statistics tool, in a
+    background thread. Adzuna is skipped when its credentials are missing, since
+    no request to it can succeed. Failures are ignored; the real request will
+    simply connect.
+    """
+    global _WARMED_LOOP
+    loop = asyncio.get_running_loop()
+    if _WARMED_LOOP is loop:
+        return
+    first_warmup = _WARMED_LOOP is None
+    # Claimed before awaiting so concurrent page loads do not warm twice
+    _WARMED_LOOP = loop
+
+    if first_warmup:
+        threading.Thread(
+            target=_warm_session, args=(_SESSION, "https://www.findsgjobs.com/"), daemon=True
+        ).start()
+
+    urls = ["https://www.findsgjobs.com/"]
+    if _CREDS_OK:
+        urls.append("https://api.adzuna.com/")
+
+    client = _get_async_client()
+    await asyncio.gather(
+        *(client.head(url, timeout=5) for url in urls),
+        return_exceptions=True
+    )
+
+
+def _truncate(text: str, limit: int = 500) -> str:
+    """Cut a job description to ``limit`` characters, marking the cut with an ellipsis."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _parse_findsgjobs_response(json_response: Dict[str, Any], page: int) -> Dict[str, Any]:
+    """
+    Convert a raw FindSGJobs search payload into the structured result dict.
+
+    Args:
+        json_response: Decoded JSON body returned by the FindSGJobs API
+        page: Requested page number (used when the pager is missing)
+
+    Returns:
+        dict: Structured job search results with success status
+    """
+    jobs = []
+    total_count = 0
+    current_page = page
+    total_pages = 0
+
+    if "data" in json_response:
+        data = json_response["data"]
+
+        # Get pagination info
+        if "pager" in data:
+            pager = data["pager"]
+            total_count = pager.get("record_count", 0)
+            current_page = pager.get("page", page)
+            total_pages = pager.get("page_count", 0)
+
+        # Extract job details
+        if "result" in data:
+            for item in data["result"]:
+                job = item.get('job') or _EMPTY
+                jget = job.get
+                company_name = (item.get('company') or _EMPTY).get('CompanyName', 'N/A')
+                job_id = jget('id', '')
+
+                # Extract salary information
+                salary_info = None
+                if not jget('id_Job_Donotdisplaysalary', 0):
+                    salary_range = jget('Salaryrange', _EMPTY).get('caption')
+                    if salary_range:
+                        currency = jget('id_Job_Currency', _EMPTY).get('caption', 'SGD')
+                        interval = jget('id_Job_Interval', _EMPTY).get('caption', 'Month')
+                        salary_info = f"{currency} {salary_range} per {interval}"
+
+                # Extract description (clean HTML)
+                description = jget('JobDescription', '')
+                if description:
+                    plain_text = html.unescape(_TAG_RE.sub(' ', description))
+                    plain_text = _WS_RE.sub('\n', plain_text).strip()
+                    description = _truncate(plain_text)
+
+                job_info = {
+                    "job_id": job_id,
+                    "title": jget('Title', 'N/A'),
+                    "company": company_name,
+                    "url": _FINDSG_JOB_URL(job_id) if job_id else '',
+                    "categories": [c['caption'] for c in jget('JobCategory', ()) if 'caption' in c],
+                    "employment_type": [c['caption'] for c in jget('EmploymentType', ()) if 'caption' in c],
+                    "location": [c['caption'] for c in jget('id_Job_NearestMRTStation', ()) if 'caption' in c],
+                    "salary": salary_info,
+                    "experience": jget('MinimumYearsofExperience', _EMPTY).get('caption', 'N/A'),
+                    "education": jget('MinimumEducationLevel', _EMPTY).get('caption', 'N/A'),
+                    "position_level": jget('id_Job_PositionLevel', _EMPTY).get('caption', 'N/A'),
+                    "work_arrangement": jget('id_Job_WorkArrangement', _EMPTY).get('caption', 'N/A'),
+                    "skills": jget('id_Job_Skills', []),
+                    "posted_date": jget('activation_date', 'N/A'),
+                    "expires_date": jget('expiration_date', 'N/A'),
+                    "description": description
+                }
+
+                jobs.append(job_info)
+
+    return {
+        "success": True,
+        "total_jobs": total_count,
+        "current_page": current_page,
+        "total_pages": total_pages,
+        "results_on_page": len(jobs),
+        "jobs": jobs
+    }
+
+
+@_cached
 def search_jobs_api(keywords: str, page: int = 1, per_page_count: int = 10) -> Dict[str, Any]:
     """
     Search for jobs using the FindSGJobs API.
@@ -33,8 +434,6 @@ def search_jobs_api(keywords: str, page: int = 1, per_page_count: int = 10) -> D
     Returns:
         dict: Structured job search results with success status
     """
-    base_url = "https://www.findsgjobs.com/apis/job/searchable"
-
     params = {
         "page": page,
         "per_page_count": min(per_page_count, 20),
@@ -42,80 +441,51 @@ def search_jobs_api(keywords: str, page: int = 1, per_page_count: int = 10) -> D
     }
 
     try:
-        response = requests.get(base_url, params=params, timeout=10)
+        response = _SESSION.get(_FINDSG_SEARCH_URL, params=params, timeout=10, stream=False)
         response.raise_for_status()
-        json_response = response.json()
-
-        # Extract and structure job data
-        jobs = []
-        total_count = 0
-        current_page = page
-        total_pages = 0
-
-        if "data" in json_response:
-            data = json_response["data"]
-
-            # Get pagination info
-            if "pager" in data:
-                pager = data["pager"]
-                total_count = pager.get("record_count", 0)
-                current_page = pager.get("page", page)
-                total_pages = pager.get("page_count", 0)
-
-            # Extract job details
-            if "result" in data:
-                for item in data["result"]:
-                    job = item.get('job', {})
-                    company = item.get('company', {})
-
-                    # Extract salary information
-                    salary_info = None
-                    if not job.get('id_Job_Donotdisplaysalary', 0):
-                        salary_range = job.get('Salaryrange', {}).get('caption')
-                        if salary_range:
-                            currency = job.get('id_Job_Currency', {}).get('caption', 'SGD')
-                            interval = job.get('id_Job_Interval', {}).get('caption', 'Month')
-                            salary_info = f"{currency} {salary_range} per {interval}"
-
-                    # Extract description (clean HTML)
-                    description = job.get('JobDescription', '')
-                    if description:
-                        soup = BeautifulSoup(description, 'html.parser')
-                        plain_text = soup.get_text()
-                        plain_text = re.sub(r'\n+', '\n', plain_text).strip()
-                        description = plain_text[:500] + '...' if len(plain_text) > 500 else plain_text
-
-                    job_info = {
-                        "job_id": job.get('id', ''),
-                        "title": job.get('Title', 'N/A'),
-                        "company": company.get('CompanyName', 'N/A'),
-                        "url": f"https://www.findsgjobs.com/job/{job.get('id', '')}" if job.get('id') else '',
-                        "categories": [cat.get('caption', '') for cat in job.get('JobCategory', [])],
-                        "employment_type": [et.get('caption', '') for et in job.get('EmploymentType', [])],
-                        "location": [mrt.get('caption', '') for mrt in job.get('id_Job_NearestMRTStation', [])],
-                        "salary": salary_info,
-                        "experience": job.get('MinimumYearsofExperience', {}).get('caption', 'N/A'),
-                        "education": job.get('MinimumEducationLevel', {}).get('caption', 'N/A'),
-                        "position_level": job.get('id_Job_PositionLevel', {}).get('caption', 'N/A'),
-                        "work_arrangement": job.get('id_Job_WorkArrangement', {}).get('caption', 'N/A'),
-                        "skills": job.get('id_Job_Skills', []),
-                        "posted_date": job.get('activation_date', 'N/A'),
-                        "expires_date": job.get('expiration_date', 'N/A'),
-                        "description": description
-                    }
-
-                    jobs.append(job_info)
+        json_response = orjson.loads(response.content)
 
+        return _parse_findsgjobs_response(json_response, page)
+
+    except requests.exceptions.RequestException as e:
         return {
-            "success": True,
-            "total_jobs": total_count,
-            "current_page": current_page,
-            "total_pages": total_pages,
-            "results_on_page": len(jobs),
-            "jobs": jobs
+            "success": False,
+            "error": f"API request failed: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
         }
 
-    except requests.exceptions.RequestException as e:
+
+@_cached
+async def search_jobs_api_async(keywords: str, page: int = 1, per_page_count: int = 10) -> Dict[str, Any]:
+    """
+    Async variant of :func:`search_jobs_api` using the shared ``httpx.AsyncClient``.
+
+    Args:
+        keywords: Search keywords (e.g., "cook", "engineer", "manager")
+        page: Page number (default: 1)
+        per_page_count: Number of results per page (default: 10, max: 20)
+
+    Returns:
+        dict: Structured job search results with success status
+    """
+    params = {
+        "page": page,
+        "per_page_count": min(per_page_count, 20),
+        "keywords": keywords
+    }
+
+    try:
+        response = await _async_get(_FINDSG_SEARCH_URL, params=params, timeout=10)
+        response.raise_for_status()
+        json_response = orjson.loads(response.content)
+
+        return _parse_findsgjobs_response(json_response, page)
+
+    except httpx.HTTPError as e:
         return {
             "success": False,
             "error": f"API request failed: {str(e)}"
@@ -148,37 +518,25 @@ def calculate_job_statistics(keywords: str, sample_size: int = 20) -> Dict[str,
     total_jobs = result.get("total_jobs", 0)
 
     # Compute statistics
-    category_counts = {}
-    employment_type_counts = {}
-    location_counts = {}
-    education_counts = {}
-    experience_counts = {}
+    category_counts = Counter()
+    employment_type_counts = Counter()
+    location_counts = Counter()
+    education_counts = Counter()
+    experience_counts = Counter()
 
     for job in jobs:
-        # Count categories
-        for category in job.get("categories", []):
-            if category:
-                category_counts[category] = category_counts.get(category, 0) + 1
-
-        # Count employment types
-        for emp_type in job.get("employment_type", []):
-            if emp_type:
-                employment_type_counts[emp_type] = employment_type_counts.get(emp_type, 0) + 1
-
-        # Count locations
-        for location in job.get("location", []):
-            if location:
-                location_counts[location] = location_counts.get(location, 0) + 1
-
-        # Count education levels
+        category_counts.update(c for c in job.get("categories", []) if c)
+        employment_type_counts.update(e for e in job.get("employment_type", []) if e)
+        location_counts.update(loc for loc in job.get("location", []) if loc)
+
+        # Count education and experience levels
         education = job.get("education")
         if education and education != "N/A":
-            education_counts[education] = education_counts.get(education, 0) + 1
+            education_counts[education] += 1
 
-        # Count experience levels
         experience = job.get("experience")
         if experience and experience != "N/A":
-            experience_counts[experience] = experience_counts.get(experience, 0) + 1
+            experience_counts[experience] += 1
 
     return {
         "success": True,
@@ -186,11 +544,11 @@ def calculate_job_statistics(keywords: str, sample_size: int = 20) -> Dict[str,
         "total_jobs_in_market": total_jobs,
         "jobs_analyzed": len(jobs),
         "statistics": {
-            "top_categories": dict(sorted(category_counts.items(), key=lambda x: x[1], reverse=True)[:5]),
-            "employment_types": employment_type_counts,
-            "top_locations": dict(sorted(location_counts.items(), key=lambda x: x[1], reverse=True)[:5]),
-            "education_requirements": education_counts,
-            "experience_requirements": experience_counts
+            "top_categories": dict(category_counts.most_common(5)),
+            "employment_types": dict(employment_type_counts),
+            "top_locations": dict(location_counts.most_common(5)),
+            "education_requirements": dict(education_counts),
+            "experience_requirements": dict(experience_counts)
         }
     }
 
@@ -199,98 +557,167 @@ def calculate_job_statistics(keywords: str, sample_size: int = 20) -> Dict[str,
 # ADZUNA API FUNCTIONS
 # ========================================
 
-def search_adzuna_jobs(
+def _adzuna_search_params(
     what: str,
-    where: str = "Singapore",
-    page: int = 1,
-    results_per_page: int = 5,
-    sort_by: str = "relevance",
-    category: Optional[str] = None
-) -> Dict[str, Any]:
+    where: str,
+    page: int,
+    results_per_page: int,
+    sort_by: str,
+    category: Optional[str]
+) -> Tuple[str, Dict[str, Any]]:
     """
-    Search for jobs using the Adzuna API.
-
-    Args:
-        what: Job title or keywords (e.g., "data analyst", "software engineer")
-        where: Location (default: "Singapore")
-        page: Page number (default: 1)
-        results_per_page: Number of results per page (default: 5, max: 50)
-        sort_by: Sort order - "relevance", "date", or "salary" (default: "relevance")
-        category: Optional job category filter
+    Build the Adzuna search URL and query parameters, excluding credentials.
 
     Returns:
-        dict: Structured job search results with success status
+        tuple: (base_url, params) for the search request
     """
-    app_id = os.environ.get("ADZUNA_APP_ID")
-    app_key = os.environ.get("ADZUNA_APP_KEY")
-    
-    if not app_id or not app_key:
-        return {
-            "success": False,
-            "error": "ADZUNA_APP_ID and ADZUNA_APP_KEY environment variables must be set. Get your credentials from https://developer.adzuna.com/"
-        }
-    
-    # Adzuna uses country codes; map common names to codes
-    country_code = "sg"  # Singapore
-    if where.lower() in ["uk", "united kingdom", "gb"]:
-        country_code = "gb"
-    elif where.lower() in ["us", "usa", "united states"]:
-        country_code = "us"
-    elif where.lower() in ["au", "australia"]:
-        country_code = "au"
-    
-    base_url = f"https://api.adzuna.com/v1/api/jobs/{country_code}/search/{page}"
-    
+    country_code = _COUNTRY_MAP.get(where.lower() if where else "", "sg")
+    base_url = _ADZUNA_SEARCH_URL(country_code, page)
+
     params = {
-        "app_id": app_id,
-        "app_key": app_key,
         "results_per_page": min(results_per_page, 50),
         "what": what,
         "where": where if country_code == "sg" else "",  # For Singapore, we can specify area
         "sort_by": sort_by
     }
-    
+
     if category:
         params["category"] = category
-    
+
+    return base_url, params
+
+
+def _adzuna_search_key(**arguments: Any) -> Tuple:
+    # Equivalent requests (e.g. "UK" vs "united kingdom") share one cache entry
+    base_url, params = _adzuna_search_params(**arguments)
+    return (base_url, tuple(sorted(params.items())))
+
+
+def _adzuna_insights_key(endpoint: str) -> Callable[..., Tuple]:
+    # Keyed on the raw arguments so a hit never builds request params; an empty
+    # category is sent the same as no category, so both share one entry
+    def make_key(location: str, category: Optional[str] = None) -> Tuple:
+        return (endpoint, location, category or None)
+    return make_key
+
+
+def _adzuna_url(base_url: str, params: Dict[str, Any]) -> str:
+    """Build a full Adzuna request URL from the credential prefix and variable params."""
+    return f"{base_url}?{_CRED_QS}&{urlencode(params)}"
+
+
+# Typed schema for Adzuna search payloads. msgspec decodes only the declared fields
+# (skipping the rest, e.g. "__CLASS__" and "adref") straight into these structs.
+# Defaults mirror the fallbacks used when a key is missing; fields Adzuna is loose
+# about (string ids, "0"/"1" flags, int or float salaries) are typed Any.
+class _AdzunaCompany(msgspec.Struct):
+    display_name: Optional[str] = "N/A"
+
+
+class _AdzunaLocation(msgspec.Struct):
+    display_name: Optional[str] = "N/A"
+
+
+class _AdzunaCategory(msgspec.Struct):
+    label: Optional[str] = "N/A"
+
+
+class _AdzunaJob(msgspec.Struct):
+    id: Any = ""
+    title: Optional[str] = "N/A"
+    company: Optional[_AdzunaCompany] = None
+    location: Optional[_AdzunaLocation] = None
+    description: Optional[str] = ""
+    created: Optional[str] = "N/A"
+    contract_type: Optional[str] = "N/A"
+    contract_time: Optional[str] = "N/A"
+    salary_min: Any = None
+    salary_max: Any = None
+    salary_is_predicted: Any = False
+    redirect_url: Optional[str] = ""
+    category: Optional[_AdzunaCategory] = None
+    latitude: Any = None
+    longitude: Any = None
+
+
+class _AdzunaSearchResponse(msgspec.Struct):
+    results: Optional[List[_AdzunaJob]] = []
+    count: Any = 0
+    mean: Any = 0
+
+
+_ADZUNA_SEARCH_DECODER = msgspec.json.Decoder(_AdzunaSearchResponse)
+
+
+def _parse_adzuna_search_response(content: bytes, page: int) -> Dict[str, Any]:
+    """
+    Decode a raw Adzuna search body into the structured result dict.
+
+    Args:
+        content: Raw JSON body returned by the Adzuna API
+        page: Requested page number
+
+    Returns:
+        dict: Structured job search results with success status
+    """
+    parsed = _ADZUNA_SEARCH_DECODER.decode(content)
+    jobs = []
+
+    for job in parsed.results or ():
+        description = _truncate(job.description or "")
+        company = job.company
+        location = job.location
+        category = job.category
+
+        job_info = {
+            "job_id": job.id,
+            "title": job.title,
+            "company": company.display_name if company else "N/A",
+            "location": location.display_name if location else "N/A",
+            "description": description,
+            "created": job.created,
+            "contract_type": job.contract_type,
+            "contract_time": job.contract_time,
+            "salary_min": job.salary_min,
+            "salary_max": job.salary_max,
+            "salary_is_predicted": job.salary_is_predicted,
+            "redirect_url": job.redirect_url,
+            "category": category.label if category else "N/A",
+            "latitude": job.latitude,
+            "longitude": job.longitude
+        }
+        jobs.append(job_info)
+
+    return {
+        "success": True,
+        "total_results": parsed.count,
+        "current_page": page,
+        "results_on_page": len(jobs),
+        "mean_salary": parsed.mean,
+        "jobs": jobs
+    }
+
+
+def _adzuna_get(url: str, params: Dict[str, Any], shape: Callable[[bytes], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Call an Adzuna endpoint through the pooled sync session.
+
+    Args:
+        url: Endpoint URL without the query string
+        params: Request params other than the credentials
+        shape: Builds the success result dict from the raw response body
+
+    Returns:
+        dict: Shaped result, or an error dict with success status
+    """
+    if not _CREDS_OK:
+        return _MISSING_CREDS_ERR
+
     try:
-        response = requests.get(base_url, params=params, timeout=15)
+        response = _ADZUNA_SESSION.get(_adzuna_url(url, params), timeout=15, stream=False)
         response.raise_for_status()
-        json_response = response.json()
-        
-        # Extract and structure job data
-        jobs = []
-        results = json_response.get("results", [])
-        
-        for job in results:
-            job_info = {
-                "job_id": job.get("id", ""),
-                "title": job.get("title", "N/A"),
-                "company": job.get("company", {}).get("display_name", "N/A"),
-                "location": job.get("location", {}).get("display_name", "N/A"),
-                "description": job.get("description", "")[:500] + "..." if len(job.get("description", "")) > 500 else job.get("description", ""),
-                "created": job.get("created", "N/A"),
-                "contract_type": job.get("contract_type", "N/A"),
-                "contract_time": job.get("contract_time", "N/A"),
-                "salary_min": job.get("salary_min"),
-                "salary_max": job.get("salary_max"),
-                "salary_is_predicted": job.get("salary_is_predicted", False),
-                "redirect_url": job.get("redirect_url", ""),
-                "category": job.get("category", {}).get("label", "N/A"),
-                "latitude": job.get("latitude"),
-                "longitude": job.get("longitude")
-            }
-            jobs.append(job_info)
-        
-        return {
-            "success": True,
-            "total_results": json_response.get("count", 0),
-            "current_page": page,
-            "results_on_page": len(jobs),
-            "mean_salary": json_response.get("mean", 0),
-            "jobs": jobs
-        }
-        
+        return shape(response.content)
+
     except requests.exceptions.RequestException as e:
         return {
             "success": False,
@@ -303,65 +730,210 @@ def search_adzuna_jobs(
         }
 
 
-def get_adzuna_histogram(
-    location: str = "Singapore",
-    category: Optional[str] = None
-) -> Dict[str, Any]:
-    """
-    Get salary distribution histogram from Adzuna.
+async def _adzuna_get_async(url: str, params: Dict[str, Any], shape: Callable[[bytes], Dict[str, Any]]) -> Dict[str, Any]:
+    """Async variant of :func:`_adzuna_get` using the shared ``httpx.AsyncClient``."""
+    if not _CREDS_OK:
+        return _MISSING_CREDS_ERR
 
-    Args:
-        location: Location to get salary data for (default: "Singapore")
-        category: Optional job category filter
+    try:
+        response = await _async_get(_adzuna_url(url, params), timeout=15)
+        response.raise_for_status()
+        return shape(response.content)
 
-    Returns:
-        dict: Salary distribution data with success status
-    """
-    app_id = os.environ.get("ADZUNA_APP_ID")
-    app_key = os.environ.get("ADZUNA_APP_KEY")
-    
-    if not app_id or not app_key:
+    except httpx.HTTPError as e:
         return {
             "success": False,
-            "error": "ADZUNA_APP_ID and ADZUNA_APP_KEY environment variables must be set"
+            "error": f"API request failed: {str(e)}"
         }
-    
-    country_code = "sg"
-    base_url = f"https://api.adzuna.com/v1/api/jobs/{country_code}/histogram"
-    
-    params = {
-        "app_id": app_id,
-        "app_key": app_key,
-        "location0": location
-    }
-    
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }
+
+
+def _adzuna_insights_params(location: str, category: Optional[str] = None) -> Dict[str, Any]:
+    params = {"location0": location}
     if category:
         params["category"] = category
-    
-    try:
-        response = requests.get(base_url, params=params, timeout=15)
-        response.raise_for_status()
-        json_response = response.json()
-        
+    return params
+
+
+def _shape_histogram(location: str, category: Optional[str]) -> Callable[[bytes], Dict[str, Any]]:
+    def shape(content: bytes) -> Dict[str, Any]:
         return {
             "success": True,
-            "histogram": json_response.get("histogram", {}),
+            "histogram": orjson.loads(content).get("histogram", {}),
             "location": location,
             "category": category
         }
-        
-    except requests.exceptions.RequestException as e:
+    return shape
+
+
+def _shape_top_companies(location: str) -> Callable[[bytes], Dict[str, Any]]:
+    def shape(content: bytes) -> Dict[str, Any]:
         return {
-            "success": False,
-            "error": f"API request failed: {str(e)}"
+            "success": True,
+            "top_companies": orjson.loads(content).get("leaderboard", []),
+            "location": location
         }
-    except Exception as e:
+    return shape
+
+
+@_cached(cache=_ADZUNA_SEARCH_CACHE, key=_adzuna_search_key)
+def search_adzuna_jobs(
+    what: str,
+    where: str = "Singapore",
+    page: int = 1,
+    results_per_page: int = 5,
+    sort_by: str = "relevance",
+    category: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Search for jobs using the Adzuna API.
+
+    Args:
+        what: Job title or keywords (e.g., "data analyst", "software engineer")
+        where: Location (default: "Singapore")
+        page: Page number (default: 1)
+        results_per_page: Number of results per page (default: 5, max: 50)
+        sort_by: Sort order - "relevance", "date", or "salary" (default: "relevance")
+        category: Optional job category filter
+
+    Returns:
+        dict: Structured job search results with success status
+    """
+    base_url, params = _adzuna_search_params(what, where, page, results_per_page, sort_by, category)
+    return _adzuna_get(base_url, params, lambda content: _parse_adzuna_search_response(content, page))
+
+
+@_cached(cache=_ADZUNA_SEARCH_CACHE, key=_adzuna_search_key)
+async def search_adzuna_jobs_async(
+    what: str,
+    where: str = "Singapore",
+    page: int = 1,
+    results_per_page: int = 5,
+    sort_by: str = "relevance",
+    category: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Async variant of :func:`search_adzuna_jobs` using the shared ``httpx.AsyncClient``.
+
+    Args:
+        what: Job title or keywords (e.g., "data analyst", "software engineer")
+        where: Location (default: "Singapore")
+        page: Page number (default: 1)
+        results_per_page: Number of results per page (default: 5, max: 50)
+        sort_by: Sort order - "relevance", "date", or "salary" (default: "relevance")
+        category: Optional job category filter
+
+    Returns:
+        dict: Structured job search results with success status
+    """
+    base_url, params = _adzuna_search_params(what, where, page, results_per_page, sort_by, category)
+    return await _adzuna_get_async(base_url, params, lambda content: _parse_adzuna_search_response(content, page))
+
+
+async def search_adzuna_jobs_pages_async(
+    what: str,
+    where: str = "Singapore",
+    start_page: int = 1,
+    page_count: int = 2,
+    results_per_page: int = 5,
+    sort_by: str = "relevance",
+    category: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Fetch consecutive Adzuna result pages concurrently and merge them.
+
+    The merged result uses the same keys as a single :func:`search_adzuna_jobs_async`
+    page, with ``current_page`` as the first page requested and ``results_on_page``
+    counting every merged job, plus ``failed_pages`` listing the pages that could
+    not be fetched. Pages that succeeded are kept even when others fail.
+
+    Args:
+        what: Job title or keywords (e.g., "data analyst", "software engineer")
+        where: Location (default: "Singapore")
+        start_page: First page number to fetch (default: 1)
+        page_count: Number of consecutive pages to fetch (default: 2, max: 5)
+        results_per_page: Number of results per page (default: 5, max: 50)
+        sort_by: Sort order - "relevance", "date", or "salary" (default: "relevance")
+        category: Optional job category filter
+
+    Returns:
+        dict: Merged job search results with success status
+    """
+    pages = range(start_page, start_page + max(1, min(page_count, 5)))
+    results = await asyncio.gather(*(
+        search_adzuna_jobs_async(what, where, page, results_per_page, sort_by, category)
+        for page in pages
+    ))
+
+    succeeded = [result for result in results if result.get("success")]
+    failed_pages = [
+        {"page": page, "error": result.get("error", "Unknown error")}
+        for page, result in zip(pages, results)
+        if not result.get("success")
+    ]
+
+    if not succeeded:
         return {
             "success": False,
-            "error": f"Unexpected error: {str(e)}"
+            "error": failed_pages[0]["error"],
+            "failed_pages": failed_pages
         }
 
+    jobs = [job for result in succeeded for job in result["jobs"]]
+    return {
+        "success": True,
+        "total_results": succeeded[0]["total_results"],
+        "current_page": start_page,
+        "results_on_page": len(jobs),
+        "mean_salary": succeeded[0]["mean_salary"],
+        "jobs": jobs,
+        "failed_pages": failed_pages
+    }
+
+
+@_cached(cache=_ADZUNA_INSIGHTS_CACHE, key=_adzuna_insights_key("histogram"))
+def get_adzuna_histogram(
+    location: str = "Singapore",
+    category: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get salary distribution histogram from Adzuna.
+
+    Args:
+        location: Location to get salary data for (default: "Singapore")
+        category: Optional job category filter
+
+    Returns:
+        dict: Salary distribution data with success status
+    """
+    params = _adzuna_insights_params(location, category)
+    return _adzuna_get(_ADZUNA_HISTOGRAM_URL, params, _shape_histogram(location, category))
+
+
+@_cached(cache=_ADZUNA_INSIGHTS_CACHE, key=_adzuna_insights_key("histogram"))
+async def get_adzuna_histogram_async(
+    location: str = "Singapore",
+    category: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Async variant of :func:`get_adzuna_histogram` using the shared ``httpx.AsyncClient``.
+
+    Args:
+        location: Location to get salary data for (default: "Singapore")
+        category: Optional job category filter
+
+    Returns:
+        dict: Salary distribution data with success status
+    """
+    params = _adzuna_insights_params(location, category)
+    return await _adzuna_get_async(_ADZUNA_HISTOGRAM_URL, params, _shape_histogram(location, category))
+
 
+@_cached(cache=_ADZUNA_INSIGHTS_CACHE, key=_adzuna_insights_key("top_companies"))
 def get_adzuna_top_companies(
     location: str = "Singapore"
 ) -> Dict[str, Any]:
@@ -374,42 +946,22 @@ def get_adzuna_top_companies(
     Returns:
         dict: Top companies data with success status
     """
-    app_id = os.environ.get("ADZUNA_APP_ID")
-    app_key = os.environ.get("ADZUNA_APP_KEY")
-    
-    if not app_id or not app_key:
-        return {
-            "success": False,
-            "error": "ADZUNA_APP_ID and ADZUNA_APP_KEY environment variables must be set"
-        }
-    
-    country_code = "sg"
-    base_url = f"https://api.adzuna.com/v1/api/jobs/{country_code}/top_companies"
-    
-    params = {
-        "app_id": app_id,
-        "app_key": app_key,
-        "location0": location
-    }
-    
-    try:
-        response = requests.get(base_url, params=params, timeout=15)
-        response.raise_for_status()
-        json_response = response.json()
-        
-        return {
-            "success": True,
-            "top_companies": json_response.get("leaderboard", []),
-            "location": location
-        }
-        
-    except requests.exceptions.RequestException as e:
-        return {
-            "success": False,
-            "error": f"API request failed: {str(e)}"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }
+    params = _adzuna_insights_params(location)
+    return _adzuna_get(_ADZUNA_TOP_COMPANIES_URL, params, _shape_top_companies(location))
+
+
+@_cached(cache=_ADZUNA_INSIGHTS_CACHE, key=_adzuna_insights_key("top_companies"))
+async def get_adzuna_top_companies_async(
+    location: str = "Singapore"
+) -> Dict[str, Any]:
+    """
+    Async variant of :func:`get_adzuna_top_companies` using the shared ``httpx.AsyncClient``.
+
+    Args:
+        location: Location to get company data for (default: "Singapore")
+
+    Returns:
+        dict: Top companies data with success status
+    """
+    params = _adzuna_insights_params(location)
+    return await _adzuna_get_async(_ADZUNA_TOP_COMPANIES_URL, params, _shape_top_companies(location))